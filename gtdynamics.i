@@ -688,6 +688,16 @@ gtsam::Vector Torque(const gtsam::VectorValues &values, int j, int t=0);
 
 double Torque(const gtsam::Values &values, int j, int t=0);
 
+void InsertJointAngles(gtsam::Values @values, const std::vector<int> &js, int t,
+                       const gtsam::Vector &qs);
+
+void InsertJointVels(gtsam::Values @values, const std::vector<int> &js, int t,
+                     const gtsam::Vector &vs);
+
+void InsertJointStates(gtsam::Values @values, const std::vector<int> &js, int t,
+                       const gtsam::Vector &qs, const gtsam::Vector &vs,
+                       const gtsam::Vector &torques);
+
 void InsertPose(gtsam::Values @values, int i, int t, gtsam::Pose3 value);
 
 void InsertPose(gtsam::Values @values, int i, gtsam::Pose3 value);
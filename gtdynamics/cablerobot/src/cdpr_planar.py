@@ -15,6 +15,8 @@ import gtsam
 import numpy as np
 from gtsam import Pose3, Rot3
 
+from utils import IDENTITY_POSE, ZERO3, ZERO6
+
 
 class CdprParams:
     """Parameters relevant to cable robot geometry and properties
@@ -106,42 +108,42 @@ class Cdpr:
             gtsam.NonlinearFactorGraph: The factors for kinematics
         """
         kfg = gtsam.NonlinearFactorGraph()
+        lid = self.ee_id()
+        # selects the out-of-plane components (rx, rz, y) of a Pose/Twist
+        planar_selection = np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
+                                     [0, 0, 0, 0, 1, 0.]])
         for k in ks:
+            pose_key = gtd.PoseKey(lid, k).key()
+            twist_key = gtd.TwistKey(lid, k).key()
             for ji in range(4):
                 kfg.push_back(
                     gtd.CableLengthFactor(
                         gtd.JointAngleKey(ji, k).key(),
-                        gtd.PoseKey(self.ee_id(), k).key(),  #
+                        pose_key,  #
                         self.costmodel_l,
                         self.params.a_locs[ji],
                         self.params.b_locs[ji]))
                 kfg.push_back(
                     gtd.CableVelocityFactor(
                         gtd.JointVelKey(ji, k).key(),
-                        gtd.PoseKey(self.ee_id(), k).key(),
-                        gtd.TwistKey(self.ee_id(), k).key(),  #
+                        pose_key,
+                        twist_key,  #
                         self.costmodel_ldot,
                         self.params.a_locs[ji],
                         self.params.b_locs[ji]))
             # constrain out-of-plane movements
             zeroT = gtsam.Values()
-            gtd.InsertPose(zeroT, self.ee_id(), k, Pose3())
+            gtd.InsertPose(zeroT, lid, k, IDENTITY_POSE)
             kfg.push_back(
                 gtsam.LinearContainerFactor(
-                    gtsam.JacobianFactor(
-                        gtd.PoseKey(self.ee_id(), k).key(),
-                        np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
-                                  [0, 0, 0, 0, 1, 0.]]), np.zeros(3),
-                        self.costmodel_planar_pose), zeroT))
+                    gtsam.JacobianFactor(pose_key, planar_selection, ZERO3,
+                                         self.costmodel_planar_pose), zeroT))
             zeroV = gtsam.Values()
-            gtd.InsertTwist(zeroV, self.ee_id(), k, np.zeros(6))
+            gtd.InsertTwist(zeroV, lid, k, ZERO6)
             kfg.push_back(
                 gtsam.LinearContainerFactor(
-                    gtsam.JacobianFactor(
-                        gtd.TwistKey(self.ee_id(), k).key(),
-                        np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
-                                  [0, 0, 0, 0, 1, 0.]]), np.zeros(3),
-                        self.costmodel_planar_twist), zeroV))
+                    gtsam.JacobianFactor(twist_key, planar_selection, ZERO3,
+                                         self.costmodel_planar_twist), zeroV))
         return kfg
 
     def dynamics_factors(self, ks=[]):
@@ -159,22 +161,21 @@ class Cdpr:
             gtsam.NonlinearFactorGraph: The dynamics factors
         """
         dfg = gtsam.NonlinearFactorGraph()
+        eelink = self.eelink()
+        lid = eelink.id()
         for k in ks:
+            wrench_keys = [gtd.WrenchKey(lid, ji, k) for ji in range(4)]
+            pose_key = gtd.PoseKey(lid, k).key()
             # TODO(yetong): Use EqualityConstraint.createFactor when wrapped.
             dfg.add(
-                gtd.WrenchFactor(self.costmodel_wrench, self.eelink(), [
-                    gtd.WrenchKey(self.ee_id(), 0, k),
-                    gtd.WrenchKey(self.ee_id(), 1, k),
-                    gtd.WrenchKey(self.ee_id(), 2, k),
-                    gtd.WrenchKey(self.ee_id(), 3, k)
-                ], k, self.params.gravity))
+                gtd.WrenchFactor(self.costmodel_wrench, eelink, wrench_keys, k,
+                                 self.params.gravity))
             for ji in range(4):
                 dfg.push_back(
                     gtd.CableTensionFactor(
                         gtd.TorqueKey(ji, k).key(),
-                        gtd.PoseKey(self.ee_id(), k).key(),
-                        gtd.WrenchKey(self.ee_id(), ji,
-                                      k).key(), self.costmodel_torque,
+                        pose_key,
+                        wrench_keys[ji].key(), self.costmodel_torque,
                         self.params.a_locs[ji], self.params.b_locs[ji]))
         return dfg
 
@@ -192,18 +193,19 @@ class Cdpr:
             gtsam.NonlinearFactorGraph: the collocation factors
         """
         dfg = gtsam.NonlinearFactorGraph()
+        lid = self.ee_id()
         for k in ks:
             dfg.push_back(
                 gtd.EulerPoseCollocationFactor(
-                    gtd.PoseKey(self.ee_id(), k).key(),
-                    gtd.PoseKey(self.ee_id(), k + 1).key(),
-                    gtd.TwistKey(self.ee_id(), k).key(), 0,
+                    gtd.PoseKey(lid, k).key(),
+                    gtd.PoseKey(lid, k + 1).key(),
+                    gtd.TwistKey(lid, k).key(), 0,
                     self.costmodel_posecollo))
             dfg.push_back(
                 gtd.EulerTwistCollocationFactor(
-                    gtd.TwistKey(self.ee_id(), k).key(),
-                    gtd.TwistKey(self.ee_id(), k + 1).key(),
-                    gtd.TwistAccelKey(self.ee_id(), k).key(), 0,
+                    gtd.TwistKey(lid, k).key(),
+                    gtd.TwistKey(lid, k + 1).key(),
+                    gtd.TwistAccelKey(lid, k).key(), 0,
                     self.costmodel_twistcollo))
         dfg.push_back(gtd.PriorFactorDouble(0, dt, self.costmodel_dt))
         return dfg
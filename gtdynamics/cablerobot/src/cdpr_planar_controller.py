@@ -43,8 +43,13 @@ class CdprControllerBase:
 class CdprController(CdprControllerBase):
     """Precomputes the open-loop trajectory
     then just calls on that for each update.
+
+    Most of the construction time is spent linearizing and eliminating the trajectory factor graph.
+    GTSAM parallelizes both when it is built with TBB (`cmake -DGTSAM_WITH_TBB=ON`).  Elimination
+    uses a stagewise (time-ordered) ordering, see `create_ordering`, which follows the chain
+    structure of the trajectory problem.
     """
-    def __init__(self, cdpr, x0, pdes=[], dt=0.01, Q=None, R=np.array([1.])):
+    def __init__(self, cdpr, x0, pdes=[], dt=0.01, Q=None, R=np.array([1.]), x_guess=None):
         """constructor
 
         Args:
@@ -55,26 +60,112 @@ class CdprController(CdprControllerBase):
             Q (np.ndarray, optional): State objective cost (as a vector). Defaults to None, which
             denotes a constrained noise model.
             R (np.ndarray, optional): Control cost (as a 1-vector). Defaults to np.array([1.]).
+            x_guess (gtsam.Values, optional): Initial guess for the optimization. Defaults to None,
+            which initializes all variables with zeros.
         """
         self.cdpr = cdpr
         self.pdes = pdes
         self.dt = dt
+        self.Q = Q
+        self.R = R
+
+        # nothing to optimize without a desired trajectory
+        if len(pdes) == 0:
+            self.optimizer = None
+            self.result = gtsam.Values()
+            self.fg = gtsam.NonlinearFactorGraph()
+            return
 
         # create iLQR graph
         fg = self.create_ilqr_fg(cdpr, x0, pdes, dt, Q, R)
         # initial guess
-        init = utils.zerovalues(cdpr.ee_id(), range(len(pdes)), dt=dt)
+        if x_guess is None:
+            x_guess = utils.zerovalues(cdpr.ee_id(), range(len(pdes)), dt=dt)
         # optimize
-        self.optimizer = gtsam.LevenbergMarquardtOptimizer(fg, init)
+        params = gtsam.LevenbergMarquardtParams()
+        params.setOrdering(self.create_ordering(cdpr, len(pdes)))
+        self.optimizer = gtsam.LevenbergMarquardtOptimizer(fg, x_guess, params)
         self.result = self.optimizer.optimize()
         self.fg = fg
 
+    @classmethod
+    def rebuild_from_previous(cls, prev_controller, new_pdes, x0=None, shift=1):
+        """Creates a controller for a receding-horizon problem which is warm-started from the
+        solution of a previous controller.  The previous solution is shifted back in time by `shift`
+        time steps and used as the initial guess; any time steps at the end of the new horizon which
+        have no counterpart in the previous solution are initialized with zeros.
+
+        Args:
+            prev_controller (CdprController): the previously solved controller
+            new_pdes (List[gtsam.Pose3]): desired poses for the new horizon
+            x0 (gtsam.Values, optional): initial state of the new horizon. Defaults to None, which
+            uses the Pose/Twist of the previous solution at time step `shift`.
+            shift (int, optional): number of time steps the horizon has advanced. Defaults to 1.
+
+        Returns:
+            CdprController: the new controller
+
+        Raises:
+            ValueError: if `x0` is not given and the previous solution has no state at time step
+            `shift`, e.g. because the previous controller had an empty trajectory
+        """
+        cdpr = prev_controller.cdpr
+        lid = cdpr.ee_id()
+        if x0 is None:
+            if not prev_controller.result.exists(gtd.PoseKey(lid, shift).key()):
+                raise ValueError(
+                    "The previous solution has no state at time step {:d}; pass x0 explicitly"
+                    .format(shift))
+            x0 = gtsam.Values()
+            gtd.InsertPose(x0, lid, 0, gtd.Pose(prev_controller.result, lid, shift))
+            gtd.InsertTwist(x0, lid, 0, gtd.Twist(prev_controller.result, lid, shift))
+        x_guess = utils.shiftvalues(prev_controller.result,
+                                    lid,
+                                    range(len(new_pdes)),
+                                    shift=shift,
+                                    dt=prev_controller.dt)
+        return cls(cdpr,
+                   x0,
+                   new_pdes,
+                   dt=prev_controller.dt,
+                   Q=prev_controller.Q,
+                   R=prev_controller.R,
+                   x_guess=x_guess)
+
     def update(self, values, t):
         """New control: returns the entire results vector, which contains the optimal open-loop
         control from the optimal trajectory.
         """
         return self.result
 
+    @staticmethod
+    def create_ordering(cdpr, N):
+        """Creates a stagewise elimination ordering for the iLQR problem: the variables of each time
+        step are eliminated before those of the next time step, and the time step duration (key 0),
+        which is shared by all time steps, is eliminated last.
+        The ordering must contain exactly the variables of `create_ilqr_fg`.
+
+        Args:
+            cdpr (Cdpr): cable robot object
+            N (int): number of time steps
+
+        Returns:
+            gtsam.Ordering: The elimination ordering
+        """
+        lid = cdpr.ee_id()
+        ordering = gtsam.Ordering()
+        for k in range(N):
+            for ji in range(4):
+                ordering.push_back(gtd.JointAngleKey(ji, k).key())
+                ordering.push_back(gtd.JointVelKey(ji, k).key())
+                ordering.push_back(gtd.TorqueKey(ji, k).key())
+                ordering.push_back(gtd.WrenchKey(lid, ji, k).key())
+            ordering.push_back(gtd.TwistAccelKey(lid, k).key())
+            ordering.push_back(gtd.PoseKey(lid, k).key())
+            ordering.push_back(gtd.TwistKey(lid, k).key())
+        ordering.push_back(0)
+        return ordering
+
     @staticmethod
     def create_ilqr_fg(cdpr, x0, pdes, dt, Q, R):
         """Creates the factor graph for the iLQR problem.  This essentially consists of creating a
@@ -99,18 +190,17 @@ class CdprController(CdprControllerBase):
                             Vs=[gtd.Twist(x0, cdpr.ee_id(), 0)])
         # dynamics
         fg.push_back(cdpr.all_factors(N, dt))
+        # noise models and keys are shared by all the cost factors
+        cost_u = gtsam.noiseModel.Diagonal.Precisions(R)
+        cost_x = gtsam.noiseModel.Isotropic.Sigma(6, 0.001) if Q is None else \
+            gtsam.noiseModel.Diagonal.Precisions(Q)
+        torque_keys = [[gtd.TorqueKey(ji, k).key() for ji in range(4)] for k in range(N)]
+        lid = cdpr.ee_id()
         # control costs
         for k in range(N):
             for ji in range(4):
-                fg.push_back(
-                    gtd.PriorFactorDouble(
-                        gtd.TorqueKey(ji, k).key(), 0.0,
-                        gtsam.noiseModel.Diagonal.Precisions(R)))
+                fg.push_back(gtd.PriorFactorDouble(torque_keys[k][ji], 0.0, cost_u))
         # state objective costs
-        cost_x = gtsam.noiseModel.Isotropic.Sigma(6, 0.001) if Q is None else \
-            gtsam.noiseModel.Diagonal.Precisions(Q)
         for k in range(N):
-            fg.push_back(
-                gtsam.PriorFactorPose3(
-                    gtd.PoseKey(cdpr.ee_id(), k).key(), pdes[k], cost_x))
+            fg.push_back(gtsam.PriorFactorPose3(gtd.PoseKey(lid, k).key(), pdes[k], cost_x))
         return fg
@@ -14,6 +14,11 @@ import gtsam
 import gtdynamics as gtd
 import numpy as np
 
+from utils import INIT_POSE, ZERO4, ZERO6
+
+# ids of the four cable joints
+_JOINTS = [0, 1, 2, 3]
+
 class CdprSimulator:
     """Simulates a cable robot forward in time, given a robot, initial state, and controller.
 
@@ -56,71 +61,110 @@ class CdprSimulator:
         self.reset()
 
     @staticmethod
-    def update_kinematics(cdpr, fg, x, k):
+    def update_kinematics(cdpr, isam, x, k):
         """Runs IK to solve for the cable lengths and velocities at time step k
 
         Args:
-            fg (gtsam.NonlineaFactorGraph): any previous factors, if applicable
+            cdpr (Cdpr): the cable robot
+            isam (gtsam.ISAM2): incremental solver containing any previous factors, if applicable
             x (gtsam.Values): Values object containing the current Pose and current Twist, plus any
-            other values that may be needed (as initial guesses) for the `fg` argument.
+            other values that have already been added to `isam`.
             k (int): current time step
 
         Returns:
-            tuple(gtsam.NonlinearFactorGraph, gtsam.Values): the updated factor graph and values
+            tuple(gtsam.ISAM2, gtsam.Values): the updated incremental solver and values
         """
+        lid = cdpr.ee_id()
+        pose, twist = gtd.Pose(x, lid, k), gtd.Twist(x, lid, k)
         # IK for this time step, graph
-        fg.push_back(cdpr.kinematics_factors(ks=[k]))
-        fg.push_back(
-            cdpr.priors_ik(ks=[k],
-                           Ts=[gtd.Pose(x, cdpr.ee_id(), k)],
-                           Vs=[gtd.Twist(x, cdpr.ee_id(), k)]))
+        fg = cdpr.kinematics_factors(ks=[k])
+        fg.push_back(cdpr.priors_ik(ks=[k], Ts=[pose], Vs=[twist]))
         # IK initial estimate
-        for j in range(4):
-            gtd.InsertJointAngle(x, j, k, 0)
-            gtd.InsertJointVel(x, j, k, 0)
+        init = gtsam.Values()
+        gtd.InsertJointAngles(init, _JOINTS, k, ZERO4)
+        gtd.InsertJointVels(init, _JOINTS, k, ZERO4)
+        x.insert(init)
+        # the initial Pose/Twist have not been added to the solver yet
+        if k == 0:
+            gtd.InsertPose(init, lid, k, pose)
+            gtd.InsertTwist(init, lid, k, twist)
         # IK solve
-        result = gtsam.LevenbergMarquardtOptimizer(fg, x).optimize()
+        result = CdprSimulator.solve_incremental(isam, fg, init)
         assert abs(fg.error(result)) < 1e-20, "inverse kinematics didn't converge"
         x.update(result)
-        return fg, x
+        return isam, x
 
     @staticmethod
-    def update_dynamics(cdpr, fg, x, u, k, dt):
+    def update_dynamics(cdpr, isam, x, u, k, dt):
         """Runs ID to solve for the twistAccel, and also runs collocation to get the next timestep
         Pose/Twist
 
         Args:
             cdpr (Cdpr): the cable robot
-            fg (gtsam.NonlinearFactorGraph): a factor graph containing any previous factors
+            isam (gtsam.ISAM2): incremental solver containing any previous factors
             x (gtsam.Values): Values object containing at least the current Pose and Twist, and any
-            other values that may be needed (as initial guesses) for the `fg` argument
+            other values that have already been added to `isam`
             u (gtsam.Values): The current joint torques
             k (int): The current time index
             dt (float): the time slice duration
 
         Returns:
-            tuple(gtsam.NonlinearFactorGraph, gtsam.Values): the factor graph with added factors,
-            and the solution Values which adds the TwistAccel, next Pose, and next Twist to the `x`
-            argument.
+            tuple(gtsam.ISAM2, gtsam.Values): the updated incremental solver, and the solution
+            Values which adds the TwistAccel, next Pose, and next Twist to the `x` argument.
         """
+        lid = cdpr.ee_id()
+        torques = [gtd.Torque(u, ji, k) for ji in range(4)]
         # ID for this timestep + collocation to next time step
-        fg.push_back(cdpr.dynamics_factors(ks=[k]))
+        fg = cdpr.dynamics_factors(ks=[k])
         fg.push_back(cdpr.collocation_factors(ks=[k], dt=dt))
         # ID priors (torque inputs)
-        fg.push_back(
-            cdpr.priors_id(ks=[k], torquess=[[gtd.Torque(u, ji, k) for ji in range(4)]]))
+        fg.push_back(cdpr.priors_id(ks=[k], torquess=[torques]))
         # ID initial guess
+        init = gtsam.Values()
         for ji in range(4):
-            gtd.InsertTorque(x, ji, k, gtd.Torque(u, ji, k))
-            gtd.InsertWrench(x, cdpr.ee_id(), ji, k, np.zeros(6))
-        gtd.InsertPose(x, cdpr.ee_id(), k+1, gtsam.Pose3(gtsam.Rot3(), (1.5, 0, 1.5)))
-        gtd.InsertTwist(x, cdpr.ee_id(), k+1, np.zeros(6))
-        gtd.InsertTwistAccel(x, cdpr.ee_id(), k, np.zeros(6))
+            gtd.InsertTorque(init, ji, k, torques[ji])
+            gtd.InsertWrench(init, lid, ji, k, ZERO6)
+        gtd.InsertPose(init, lid, k+1, INIT_POSE)
+        gtd.InsertTwist(init, lid, k+1, ZERO6)
+        gtd.InsertTwistAccel(init, lid, k, ZERO6)
+        x.insert(init)
+        # dt (key 0) is first used by the collocation factors of the first time step
+        if k == 0:
+            init.insert(0, x.atDouble(0))
         # optimize
-        result = gtsam.LevenbergMarquardtOptimizer(fg, x).optimize()
-        assert abs(fg.error(result)) < 1e-20, "dynamics simulation didn't converge"
+        result = CdprSimulator.solve_incremental(isam, fg, init)
+        # checking every factor in the solver, once per time step, also catches drift in earlier
+        # time steps
+        assert abs(isam.getFactorsUnsafe().error(result)) < 1e-20, \
+            "dynamics simulation didn't converge"
         x.update(result)
-        return fg, x
+        return isam, x
+
+    @staticmethod
+    def solve_incremental(isam, fg, init, max_iterations=10):
+        """Adds new factors and variables to the incremental solver, then keeps relinearizing until
+        the new factors are satisfied.  Only the cliques affected by the new factors are
+        re-eliminated, but computing the estimate still touches every variable, so the cost of the
+        solve grows (slowly) with the length of the simulation.
+
+        Args:
+            isam (gtsam.ISAM2): the incremental solver
+            fg (gtsam.NonlinearFactorGraph): the new factors
+            init (gtsam.Values): initial estimates for the new variables
+            max_iterations (int, optional): maximum number of additional relinearization steps.
+            Defaults to 10.
+
+        Returns:
+            gtsam.Values: the current estimate for all variables
+        """
+        isam.update(fg, init)
+        result = isam.calculateBestEstimate()
+        for _ in range(max_iterations):
+            if fg.error(result) < 1e-20:
+                break
+            isam.update()
+            result = isam.calculateBestEstimate()
+        return result
 
     def step(self, verbose=False):
         """Performs one time step of the simulation, which consists of:
@@ -138,14 +182,14 @@ class CdprSimulator:
             print('time step: {:4d}   --   EE position: ({:.2f}, {:.2f}, {:.2f})'.format(
                 self.k,
                 *gtd.Pose(self.x, self.cdpr.ee_id(), self.k).translation()), end='  --  ')
-        self.update_kinematics(self.cdpr, self.fg, self.x, self.k)
+        self.update_kinematics(self.cdpr, self.isam, self.x, self.k)
         if self.k == 0:
             self.x.insert(0, self.dt)
         u = self.controller.update(self.x, self.k)
         if verbose:
             print('control torques: {:.2e},   {:.2e},   {:.2e},   {:.2e}'.format(
                 *[gtd.Torque(u, ji, self.k) for ji in range(4)]))
-        self.update_dynamics(self.cdpr, self.fg, self.x, u, self.k, self.dt)
+        self.update_dynamics(self.cdpr, self.isam, self.x, u, self.k, self.dt)
         self.k += 1
         return self.x
 
@@ -164,6 +208,12 @@ class CdprSimulator:
         return self.x
 
     def reset(self):
-        self.fg = gtsam.NonlinearFactorGraph()
+        params = gtsam.ISAM2Params()
+        # relinearize every update so that each time step is solved to convergence, and
+        # back-substitute every delta so that the relinearization check never sees stale deltas
+        params.setOptimizationParams(gtsam.ISAM2GaussNewtonParams(0.0))
+        params.relinearizeSkip = 1
+        params.setRelinearizeThreshold(1e-12)
+        self.isam = gtsam.ISAM2(params)
         self.x = gtsam.Values(self.x0)
         self.k = 0
@@ -45,8 +45,6 @@ def main():
     result = cdpr_sim(cdpr, x0, controller, dt=dt, N=N, verbose=True)
     poses = [gtd.Pose(result, cdpr.ee_id(), k) for k in range(N)]
 
-    # print(poses)
-
     plt.figure(1)
     plt.plot([pose.x() for pose in x_des], [pose.z() for pose in x_des], 'r-')
     plt.plot([pose.x() for pose in poses], [pose.z() for pose in poses], 'k--')
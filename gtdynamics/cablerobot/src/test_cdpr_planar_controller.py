@@ -22,14 +22,18 @@ from cdpr_planar_sim import CdprSimulator
 from gtsam.utils.test_case import GtsamTestCase
 
 class TestCdprPlanar(GtsamTestCase):
+    def setUp(self):
+        """Creates the cable robot and its initial state at rest in the center of the frame
+        """
+        self.cdpr = Cdpr()
+        self.x0 = gtsam.Values()
+        gtd.InsertPose(self.x0, self.cdpr.ee_id(), 0, Pose3(Rot3(), (1.5, 0, 1.5)))
+        gtd.InsertTwist(self.x0, self.cdpr.ee_id(), 0, np.zeros(6))
+
     def testTrajFollow(self):
         """Tests trajectory tracking controller
         """
-        cdpr = Cdpr()
-
-        x0 = gtsam.Values()
-        gtd.InsertPose(x0, cdpr.ee_id(), 0, Pose3(Rot3(), (1.5, 0, 1.5)))
-        gtd.InsertTwist(x0, cdpr.ee_id(), 0, np.zeros(6))
+        cdpr, x0 = self.cdpr, self.x0
 
         x_des = [Pose3(Rot3(), (1.5+k/20.0, 0, 1.5)) for k in range(9)]
         x_des = x_des[0:1] + x_des
@@ -39,16 +43,64 @@ class TestCdprPlanar(GtsamTestCase):
         result = sim.run(N=10)
         pAct = [gtd.Pose(result, cdpr.ee_id(), k) for k in range(10)]
 
-        if False:
-            print()
-            for k, (des, act) in enumerate(zip(x_des, pAct)):
-                print(('k: {:d}  --  des: {:.3f}, {:.3f}, {:.3f}  --  act: {:.3f}, {:.3f}, {:.3f}' +
-                       '  --  u: {:.3e},   {:.3e},   {:.3e},   {:.3e}').format(
-                           k, *des.translation(), *act.translation(),
-                           *[gtd.Torque(result, ji, k) for ji in range(4)]))
-
         for k, (des, act) in enumerate(zip(x_des, pAct)):
             self.gtsamAssertEquals(des, act, tol=1e-2)
 
+    def testOrdering(self):
+        """Tests that the stagewise ordering covers exactly the variables of the iLQR graph
+        """
+        cdpr, x0 = self.cdpr, self.x0
+
+        N = 3
+        x_des = [Pose3(Rot3(), (1.5, 0, 1.5))] * N
+        fg = CdprController.create_ilqr_fg(cdpr, x0, x_des, 0.1, None, np.array([1.]))
+        ordering = CdprController.create_ordering(cdpr, N)
+
+        ordered_keys = [ordering.at(i) for i in range(ordering.size())]
+        self.assertEqual(len(ordered_keys), len(set(ordered_keys)))
+        self.assertEqual(set(fg.keyVector()), set(ordered_keys))
+
+    def testEmptyTrajectory(self):
+        """Tests that a controller without a desired trajectory skips the optimization
+        """
+        cdpr, x0 = self.cdpr, self.x0
+
+        controller = CdprController(cdpr, x0)
+        self.assertIsNone(controller.optimizer)
+        self.assertEqual(0, controller.result.size())
+        self.assertEqual(0, controller.fg.size())
+
+    def testRebuildFromPrevious(self):
+        """Tests warm-starting a receding-horizon controller from a previous solution
+        """
+        cdpr, x0 = self.cdpr, self.x0
+
+        x_des = [Pose3(Rot3(), (1.5+k/20.0, 0, 1.5)) for k in range(9)]
+        x_des = x_des[0:1] + x_des
+        controller = CdprController(cdpr, x0=x0, pdes=x_des, dt=0.1)
+
+        # advance the horizon by one time step
+        new_des = x_des[1:] + x_des[-1:]
+        new_controller = CdprController.rebuild_from_previous(controller, new_des)
+
+        for k, des in enumerate(new_des):
+            self.gtsamAssertEquals(des,
+                                   gtd.Pose(new_controller.result, cdpr.ee_id(), k),
+                                   tol=1e-2)
+
+        # the warm start should converge to the same solution as a cold start
+        new_x0 = gtsam.Values()
+        gtd.InsertPose(new_x0, cdpr.ee_id(), 0, gtd.Pose(controller.result, cdpr.ee_id(), 1))
+        gtd.InsertTwist(new_x0, cdpr.ee_id(), 0, gtd.Twist(controller.result, cdpr.ee_id(), 1))
+        cold_controller = CdprController(cdpr, x0=new_x0, pdes=new_des, dt=0.1)
+        for k in range(len(new_des)):
+            self.gtsamAssertEquals(gtd.Pose(cold_controller.result, cdpr.ee_id(), k),
+                                   gtd.Pose(new_controller.result, cdpr.ee_id(), k),
+                                   tol=1e-3)
+
+        # there is no previous state to start from after an empty trajectory
+        with self.assertRaises(ValueError):
+            CdprController.rebuild_from_previous(CdprController(cdpr, x0), new_des)
+
 if __name__ == "__main__":
     unittest.main()
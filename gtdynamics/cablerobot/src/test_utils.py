@@ -0,0 +1,59 @@
+"""
+GTDynamics Copyright 2021, Georgia Tech Research Corporation,
+Atlanta, Georgia 30332-0415
+All Rights Reserved
+See LICENSE for the license information
+
+@file  test_utils.py
+@brief Unit tests for cable robot utility functions.
+@author Frank Dellaert
+@author Gerry Chen
+"""
+
+import unittest
+
+import gtdynamics as gtd
+import gtsam
+from gtsam import Pose3, Rot3
+import numpy as np
+import utils
+from gtsam.utils.test_case import GtsamTestCase
+
+class TestUtils(GtsamTestCase):
+    def testShiftValues(self):
+        """Tests shifting a solution back in time to initialize a new horizon
+        """
+        lid = 0
+        values = gtsam.Values()
+        values.insert(0, 0.1)
+        for t in range(3):
+            for j in range(4):
+                gtd.InsertJointAngle(values, j, t, t + 0.1 * j)
+                gtd.InsertJointVel(values, j, t, 0.)
+                gtd.InsertTorque(values, j, t, -t - 0.1 * j)
+                gtd.InsertWrench(values, lid, j, t, np.zeros(6))
+            gtd.InsertPose(values, lid, t, Pose3(Rot3(), (t, 0, 1)))
+            gtd.InsertTwist(values, lid, t, np.full(6, float(t)))
+            gtd.InsertTwistAccel(values, lid, t, np.zeros(6))
+
+        shifted = utils.shiftvalues(values, lid, range(3), shift=1, dt=0.1)
+
+        self.assertEqual(0.1, shifted.atDouble(0))
+        # values at t are those of the source at t + shift
+        for t in range(2):
+            for j in range(4):
+                self.assertEqual(t + 1 + 0.1 * j, gtd.JointAngle(shifted, j, t))
+                self.assertEqual(-t - 1 - 0.1 * j, gtd.Torque(shifted, j, t))
+            self.gtsamAssertEquals(Pose3(Rot3(), (t + 1, 0, 1)), gtd.Pose(shifted, lid, t))
+            np.testing.assert_equal(np.full(6, float(t + 1)), gtd.Twist(shifted, lid, t))
+        # the last time step has no counterpart in the source, so it is zero-filled
+        for j in range(4):
+            self.assertEqual(0, gtd.JointAngle(shifted, j, 2))
+            self.assertEqual(0, gtd.JointVel(shifted, j, 2))
+            self.assertEqual(0, gtd.Torque(shifted, j, 2))
+            np.testing.assert_equal(np.zeros(6), gtd.Wrench(shifted, lid, j, 2))
+        np.testing.assert_equal(np.zeros(6), gtd.Twist(shifted, lid, 2))
+        np.testing.assert_equal(np.zeros(6), gtd.TwistAccel(shifted, lid, 2))
+
+if __name__ == "__main__":
+    unittest.main()
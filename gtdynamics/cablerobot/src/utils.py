@@ -14,6 +14,17 @@ import gtsam
 import gtdynamics as gtd
 import numpy as np
 
+# Constants shared by the cable robot modules.  gtsam copies these wherever they are used (Values
+# insertion, factor construction), so they can be reused across time steps.  The arrays are made
+# read-only so that an accidental in-place edit fails instead of corrupting every later use.
+IDENTITY_POSE = gtsam.Pose3()
+INIT_POSE = gtsam.Pose3(gtsam.Rot3(), (1.5, 0, 1.5))  # initial guess: the center of the frame
+ZERO3 = np.zeros(3)
+ZERO4 = np.zeros(4)
+ZERO6 = np.zeros(6)
+for _zero in (ZERO3, ZERO4, ZERO6):
+    _zero.flags.writeable = False
+
 def zerovalues(lid, ts=[], dt=0.01):
     """Creates a values object for initialization, populated with zeros.
 
@@ -32,8 +43,38 @@ def zerovalues(lid, ts=[], dt=0.01):
             gtd.InsertJointAngle(zero, j, t, 0)
             gtd.InsertJointVel(zero, j, t, 0)
             gtd.InsertTorque(zero, j, t, 0)
-            gtd.InsertWrench(zero, lid, j, t, np.zeros(6))
-        gtd.InsertPose(zero, lid, t, gtsam.Pose3(gtsam.Rot3(), (1.5, 0, 1.5)))
-        gtd.InsertTwist(zero, lid, t, np.zeros(6))
-        gtd.InsertTwistAccel(zero, lid, t, np.zeros(6))
+            gtd.InsertWrench(zero, lid, j, t, ZERO6)
+        gtd.InsertPose(zero, lid, t, INIT_POSE)
+        gtd.InsertTwist(zero, lid, t, ZERO6)
+        gtd.InsertTwistAccel(zero, lid, t, ZERO6)
     return zero
+
+def shiftvalues(values, lid, ts=[], shift=1, dt=0.01):
+    """Creates a values object for initialization by shifting an existing solution back in time,
+    i.e. the values at time step t + shift are used for time step t.  Time steps which have no
+    counterpart in `values` are populated with zeros.
+
+    Args:
+        values (gtsam.Values): The solution to shift
+        lid (int): The id of the (end-effector) link
+        ts (list, optional): Time step indices. Defaults to [].
+        shift (int, optional): Number of time steps to shift by. Defaults to 1.
+        dt (float, optional): Time step duration. Defaults to 0.01.
+
+    Returns:
+        gtsam.Values: initialized values shifted from `values`
+    """
+    missing = {t for t in ts if not values.exists(gtd.PoseKey(lid, t + shift).key())}
+    shifted = zerovalues(lid, missing, dt=dt)
+    for t in ts:
+        if t in missing:
+            continue
+        for j in range(4):
+            gtd.InsertJointAngle(shifted, j, t, gtd.JointAngle(values, j, t + shift))
+            gtd.InsertJointVel(shifted, j, t, gtd.JointVel(values, j, t + shift))
+            gtd.InsertTorque(shifted, j, t, gtd.Torque(values, j, t + shift))
+            gtd.InsertWrench(shifted, lid, j, t, gtd.Wrench(values, lid, j, t + shift))
+        gtd.InsertPose(shifted, lid, t, gtd.Pose(values, lid, t + shift))
+        gtd.InsertTwist(shifted, lid, t, gtd.Twist(values, lid, t + shift))
+        gtd.InsertTwistAccel(shifted, lid, t, gtd.TwistAccel(values, lid, t + shift))
+    return shifted
@@ -10,6 +10,7 @@
 """
 
 import inspect
+import logging
 import os.path as osp
 import sys
 
@@ -27,6 +28,8 @@ from jr_graph_builder import JRGraphBuilder
 from jr_values import JRValues
 from jumping_robot import Actuator, JumpingRobot
 
+logger = logging.getLogger(__name__)
+
 
 class JRSimulator:
     # TODO(yetong) create pneumatics.py and actuator.py, which contain
@@ -379,7 +382,7 @@ class JRSimulator:
 
         values = JRValues.init_config_values(self.jr, controls)
         for k in range(num_steps):
-            print("step", k, "phase", phase)
+            logger.debug("step %d phase %d", k, phase)
             if k != 0:
                 self.step_integration(k, dt, values)
             self.step_actuation_dynamics(k, values)
@@ -397,7 +400,7 @@ class JRSimulator:
         step_phases = [phase]
         values = self.init_config_values(controls)
         for k in range(num_steps):
-            print("step", k, "phase", phase)
+            logger.debug("step %d phase %d", k, phase)
             if k != 0:
                 self.step_integration(k, dt, values, False)
             for joint in self.jr.robot.joints():
@@ -411,6 +414,11 @@ class JRSimulator:
 
 def example_simulate():
     """ Show an example robot jumping trajectory """
+    # show the per-step progress of the simulation
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    logging.getLogger(JRValues.__module__).setLevel(logging.DEBUG)
+
     yaml_file_path = osp.join(parentdir, "yaml", "robot_config.yaml")
 
     theta = np.pi / 3
@@ -10,6 +10,7 @@
 """
 
 import inspect
+import logging
 import os.path as osp
 import sys
 
@@ -25,6 +26,12 @@ sys.path.insert(0, currentdir)
 
 from jumping_robot import Actuator, JumpingRobot
 
+logger = logging.getLogger(__name__)
+
+# noise models shared by the per-step volume and mass flow computations
+_VOLUME_MODEL = noiseModel.Isotropic.Sigma(1, 0.0001)
+_PRIOR_MODEL = noiseModel.Isotropic.Sigma(1, 0.1)
+_MASS_RATE_MODEL = noiseModel.Isotropic.Sigma(1, 1e-5)
 
 class JRValues:
     """ Class of utitilities in manipulating values. """
@@ -129,10 +136,10 @@ class JRValues:
     @staticmethod
     def compute_volume(jr, delta_x):
         """ Compute actuator volume by contraction length. """
-        model = noiseModel.Isotropic.Sigma(1, 0.0001)
         d_tube = jr.params["pneumatic"]["d_tube_valve_musc"] * 0.0254
         l_tube = jr.params["pneumatic"]["l_tube_valve_musc"] * 0.0254
-        volume_factor = gtd.ActuatorVolumeFactor(0, 1, model, d_tube, l_tube)
+        volume_factor = gtd.ActuatorVolumeFactor(0, 1, _VOLUME_MODEL, d_tube,
+                                                 l_tube)
         return volume_factor.computeVolume(delta_x)
 
     @staticmethod
@@ -143,12 +150,9 @@ class JRValues:
         d_tube = jr.params["pneumatic"]["d_tube_valve_musc"] * 0.0254
         l_tube = jr.params["pneumatic"]["l_tube_valve_musc"] * 0.0254
         mu = jr.params["pneumatic"]["mu_tube"]
-        ct = jr.params["pneumatic"]["time_constant_valve"]
         epsilon = jr.params["pneumatic"]["eps_tube"]
         ct = jr.params["pneumatic"]["time_constant_valve"]
-        Rs = jr.params["pneumatic"]["Rs"]
-        temp = jr.params["pneumatic"]["T"]
-        k_const = 1.0 / (Rs * temp)
+        k_const = 1.0 / jr.gas_constant
 
         graph = gtsam.NonlinearFactorGraph()
         P_a_key = Actuator.PressureKey(j, k)
@@ -157,14 +161,12 @@ class JRValues:
         P_s = values.atDouble(P_s_key)
         P_a = values.atDouble(P_a_key)
 
-        prior_model = noiseModel.Isotropic.Sigma(1, 0.1)
-        mass_rate_model = noiseModel.Isotropic.Sigma(1, 1e-5)
-
         graph.add(
-            gtd.MassFlowRateFactor(P_a_key, P_s_key, mdot_key, mass_rate_model,
-                                   d_tube, l_tube, mu, epsilon, k_const))
-        graph.add(gtd.PriorFactorDouble(P_a_key, P_a, prior_model))
-        graph.add(gtd.PriorFactorDouble(P_s_key, P_s, prior_model))
+            gtd.MassFlowRateFactor(P_a_key, P_s_key, mdot_key,
+                                   _MASS_RATE_MODEL, d_tube, l_tube, mu,
+                                   epsilon, k_const))
+        graph.add(gtd.PriorFactorDouble(P_a_key, P_a, _PRIOR_MODEL))
+        graph.add(gtd.PriorFactorDouble(P_s_key, P_s, _PRIOR_MODEL))
 
         init_values = gtsam.Values()
         init_values.insert(P_a_key, P_a)
@@ -193,7 +195,7 @@ class JRValues:
         valve_control_factor = gtd.ValveControlFactor(t_key, To_a_key,
                                                       Tc_a_key, mdot_key,
                                                       mdot_sigma_key,
-                                                      mass_rate_model, ct)
+                                                      _MASS_RATE_MODEL, ct)
         mdot_sigma = valve_control_factor.computeExpectedTrueMassFlow(
             curr_time, To, Tc, mdot)
         return mdot, mdot_sigma
@@ -320,15 +322,14 @@ class JRValues:
     @staticmethod
     def integrate_joints(jr, values, k, dt):
         """ Integrate joint angle and velocity and add to values. """
-        for joint in jr.robot.joints():
-            j = joint.id()
-            q_prev = gtd.JointAngle(values, j, k - 1)
-            v_prev = gtd.JointVel(values, j, k - 1)
-            a_prev = gtd.JointAccel(values, j, k - 1)
-            v_curr = v_prev + a_prev * dt
-            q_curr = q_prev + v_prev * dt + 0.5 * a_prev * dt * dt
-            gtd.InsertJointAngle(values, j, k, q_curr)
-            gtd.InsertJointVel(values, j, k, v_curr)
+        js = [joint.id() for joint in jr.robot.joints()]
+        q_prev = np.array([gtd.JointAngle(values, j, k - 1) for j in js])
+        v_prev = np.array([gtd.JointVel(values, j, k - 1) for j in js])
+        a_prev = np.array([gtd.JointAccel(values, j, k - 1) for j in js])
+        v_curr = v_prev + a_prev * dt
+        q_curr = q_prev + v_prev * dt + 0.5 * a_prev * dt * dt
+        gtd.InsertJointAngles(values, js, k, q_curr)
+        gtd.InsertJointVels(values, js, k, v_curr)
 
     @staticmethod
     def integrate_torso(jr, values, k, dt):
@@ -367,5 +368,5 @@ class JRValues:
         wrench_b = gtd.Wrench(values, i, j, k)
         T_wb = gtd.Pose(values, i, k)
         wrench_w = T_wb.inverse().AdjointMap().transpose().dot(wrench_b)
-        print(side + " force: ", wrench_w[5])
+        logger.debug("%s force: %f", side, wrench_w[5])
         return wrench_w[5]
@@ -31,11 +31,28 @@ from src.robot_graph_builder import RobotGraphBuilder
 
 
 class TestJRSimulator(unittest.TestCase):
-    def setUp(self):
-        """ Set up the simulator. """
-        self.yaml_file_path = osp.join(parentdir, "yaml", "robot_config.yaml")
-        self.init_config = JumpingRobot.create_init_config()
-        self.jr_simulator = JRSimulator(self.yaml_file_path, self.init_config)
+    @classmethod
+    def setUpClass(cls):
+        """ Set up the simulator once, since none of the tests modify it. """
+        cls.yaml_file_path = osp.join(parentdir, "yaml", "robot_config.yaml")
+        cls.init_config = JumpingRobot.create_init_config()
+        cls.jr_simulator = JRSimulator(cls.yaml_file_path, cls.init_config)
+
+        # theta-independent coefficients used by cal_jr_accels
+        robot = cls.jr_simulator.jr.robot
+        m1 = robot.link("shank_r").mass()
+        m2 = robot.link("thigh_r").mass()
+        m3 = robot.link("torso").mass()
+        link_radius = cls.jr_simulator.jr.params["morphology"]["r_cyl"]
+        l_link = cls.jr_simulator.jr.params["morphology"]["l"][0]
+        g = 9.8
+        J1 = (l_link ** 2 + 3 * link_radius ** 2) * 1.0 / 12 * m1
+        J2 = (l_link ** 2 + 3 * link_radius ** 2) * 1.0 / 12 * m2
+        # total inertia is J_const + J_sin2 * sin(theta)^2
+        cls.J_const = J1 + J2 + l_link ** 2 * (1.0 / 4 * m1 + 1.0 / 4 * m2)
+        cls.J_sin2 = l_link ** 2 * 2 * (m2 + m3)
+        # gravity moment is moment_sin * sin(theta)
+        cls.moment_sin = (0.5 * m1 + 1.5 * m2 + 1.0 * m3) * g * l_link
 
     def robot(self):
         """ Return the robot model. """
@@ -43,19 +60,11 @@ class TestJRSimulator(unittest.TestCase):
 
     def cal_jr_accels(self, theta, torque_hip, torque_knee):
         """ Compute groundtruth joint accelerations from virtual work. """
-        m1 = self.robot().link("shank_r").mass()
-        m2 = self.robot().link("thigh_r").mass()
-        m3 = self.robot().link("torso").mass()
-        link_radius = self.jr_simulator.jr.params["morphology"]["r_cyl"]
-        l_link = self.jr_simulator.jr.params["morphology"]["l"][0]
-
-        g = 9.8
-        moment = (0.5 * m1 + 1.5 * m2 + 1.0 * m3) * g * l_link * np.sin(theta)
-        J1 = (l_link ** 2 + 3 * link_radius ** 2) * 1.0 / 12 * m1
-        J2 = (l_link ** 2 + 3 * link_radius ** 2) * 1.0 / 12 * m2
-        J = l_link ** 2 * (1.0 / 4 * m1 + (1.0 / 4 + 2 * np.sin(theta) ** 2) * m2 + 2 * np.sin(theta) ** 2 * m3)
+        sin_theta = np.sin(theta)
+        moment = self.moment_sin * sin_theta
+        J = self.J_const + self.J_sin2 * sin_theta ** 2
 
-        acc = (torque_hip - torque_knee * 2 - moment) / (J + J1 + J2)
+        acc = (torque_hip - torque_knee * 2 - moment) / J
         expected_q_accels = {"foot_r": acc, "knee_r": -2*acc, "hip_r": acc,
                              "hip_l": acc, "knee_l": -2*acc, "foot_l": acc}
         return expected_q_accels
@@ -74,11 +83,9 @@ class TestJRSimulator(unittest.TestCase):
         # construct known values
         values = gtsam.Values()
         k = 0
-        for joint in self.robot().joints():
-            j = joint.id()
-            gtd.InsertTorque(values, j, k, torques[j])
-            gtd.InsertJointAngle(values, j, k, qs[j])
-            gtd.InsertJointVel(values, j, k, vs[j])
+        js = [joint.id() for joint in self.robot().joints()]
+        gtd.InsertJointStates(values, js, k,
+                              np.take(qs, js), np.take(vs, js), np.take(torques, js))
         torso_pose = gtsam.Pose3(gtsam.Rot3(), gtsam.Point3(0, 0, 0.55))
         torso_i = self.robot().link("torso").id()
         gtd.InsertPose(values, torso_i, k, torso_pose)
@@ -91,10 +98,11 @@ class TestJRSimulator(unittest.TestCase):
         q_accels = gtd.DynamicsGraph.jointAccelsMap(self.robot(),
                                                     values, k)
         expected_q_accels = self.cal_jr_accels(theta, torque_hip, torque_knee)
-        for joint in self.robot().joints():
-            name = joint.name()
-            self.assertAlmostEqual(q_accels[name],
-                                   expected_q_accels[name], places=7)
+        names = [joint.name() for joint in self.robot().joints()]
+        actual = np.array([q_accels[name] for name in names])
+        expected = np.array([expected_q_accels[name] for name in names])
+        # same tolerance as assertAlmostEqual(places=7)
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=5e-8)
 
     def test_actuation_forward_dynamics(self):
         """ Test forward dynamics of actuator: specify mass, time, controls,
@@ -30,11 +30,12 @@ from src.jumping_robot import Actuator, JumpingRobot
 class TestJRValues(unittest.TestCase):
     """ Tests for jumping robot. """
 
-    def setUp(self):
-        """ Set up the jumping robot. """
-        self.yaml_file_path = osp.join(parentdir, "yaml", "robot_config.yaml")
-        self.init_config = JumpingRobot.create_init_config()
-        self.jr = JumpingRobot(self.yaml_file_path, self.init_config)
+    @classmethod
+    def setUpClass(cls):
+        """ Set up the jumping robot once, since none of the tests modify it. """
+        cls.yaml_file_path = osp.join(parentdir, "yaml", "robot_config.yaml")
+        cls.init_config = JumpingRobot.create_init_config()
+        cls.jr = JumpingRobot(cls.yaml_file_path, cls.init_config)
 
     def test_compute_mass_flow_convergence(self):
         """ Test computation of air mass flow, which should converge. """
@@ -14,6 +14,8 @@
 
 #include <gtdynamics/utils/values.h>
 
+#include <stdexcept>
+
 namespace gtdynamics {
 
 using gtsam::Pose3;
@@ -99,6 +101,48 @@ double Torque(const Values &values, int j, int t) {
   return at<double>(values, TorqueKey(j, t));
 };
 
+/* ************************************************************************* */
+void InsertJointAngles(Values *values, const std::vector<int> &js, int t,
+                       const Vector &qs) {
+  if (static_cast<size_t>(qs.size()) != js.size()) {
+    throw std::invalid_argument(
+        "InsertJointAngles: qs must have one entry per joint");
+  }
+  for (size_t i = 0; i < js.size(); i++) {
+    values->insert(JointAngleKey(js[i], t), qs(i));
+  }
+}
+
+/* ************************************************************************* */
+void InsertJointVels(Values *values, const std::vector<int> &js, int t,
+                     const Vector &vs) {
+  if (static_cast<size_t>(vs.size()) != js.size()) {
+    throw std::invalid_argument(
+        "InsertJointVels: vs must have one entry per joint");
+  }
+  for (size_t i = 0; i < js.size(); i++) {
+    values->insert(JointVelKey(js[i], t), vs(i));
+  }
+}
+
+/* ************************************************************************* */
+void InsertJointStates(Values *values, const std::vector<int> &js, int t,
+                       const Vector &qs, const Vector &vs,
+                       const Vector &torques) {
+  const size_t n = js.size();
+  if (static_cast<size_t>(qs.size()) != n ||
+      static_cast<size_t>(vs.size()) != n ||
+      static_cast<size_t>(torques.size()) != n) {
+    throw std::invalid_argument(
+        "InsertJointStates: qs, vs and torques must have one entry per joint");
+  }
+  for (size_t i = 0; i < n; i++) {
+    values->insert(JointAngleKey(js[i], t), qs(i));
+    values->insert(JointVelKey(js[i], t), vs(i));
+    values->insert(TorqueKey(js[i], t), torques(i));
+  }
+}
+
 /* ************************************************************************* */
 /// Insert pose for i-th link at time t.
 void InsertPose(Values *values, int i, int t, Pose3 value) {
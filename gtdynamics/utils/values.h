@@ -19,6 +19,8 @@
 #include <gtsam/linear/VectorValues.h>
 #include <gtsam/nonlinear/Values.h>
 
+#include <vector>
+
 #define GTD_PRINT(x) ((x).print(#x, gtdynamics::_GTDKeyFormatter))
 
 namespace gtdynamics {
@@ -264,6 +266,48 @@ gtsam::Vector Torque(const gtsam::VectorValues &values, int j, int t = 0);
  */
 double Torque(const gtsam::Values &values, int j, int t = 0);
 
+/* *************************************************************************
+  Functions for Joint States.
+ ************************************************************************* */
+
+/**
+ * @brief Insert joint angles of several joints at time t, in a single call.
+ *
+ * @param values Values dictionary pointer to insert joint angles into.
+ * @param js The joint ids.
+ * @param t Time step.
+ * @param qs The joint angles, one per joint id.
+ */
+void InsertJointAngles(gtsam::Values *values, const std::vector<int> &js,
+                       int t, const gtsam::Vector &qs);
+
+/**
+ * @brief Insert joint velocities of several joints at time t, in a single
+ * call.
+ *
+ * @param values Values dictionary pointer to insert joint velocities into.
+ * @param js The joint ids.
+ * @param t Time step.
+ * @param vs The joint velocities, one per joint id.
+ */
+void InsertJointVels(gtsam::Values *values, const std::vector<int> &js, int t,
+                     const gtsam::Vector &vs);
+
+/**
+ * @brief Insert joint angles, velocities and torques of several joints at
+ * time t, in a single call.
+ *
+ * @param values Values dictionary pointer to insert joint states into.
+ * @param js The joint ids.
+ * @param t Time step.
+ * @param qs The joint angles, one per joint id.
+ * @param vs The joint velocities, one per joint id.
+ * @param torques The torques, one per joint id.
+ */
+void InsertJointStates(gtsam::Values *values, const std::vector<int> &js,
+                       int t, const gtsam::Vector &qs, const gtsam::Vector &vs,
+                       const gtsam::Vector &torques);
+
 /* *************************************************************************
   Functions for Poses.
  ************************************************************************* */
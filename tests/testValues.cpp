@@ -34,6 +34,44 @@ TEST(Values, at) {
   CHECK_EXCEPTION(TwistAccel(values, 7), KeyDoesNotExist);
 }
 
+TEST(Values, InsertJointAnglesVels) {
+  gtsam::Values values;
+  InsertJointAngles(&values, {2, 5}, 3, gtsam::Vector2(0.1, 0.2));
+  InsertJointVels(&values, {2, 5}, 3, gtsam::Vector2(1.1, 1.2));
+
+  EXPECT_LONGS_EQUAL(4, values.size());
+  EXPECT_DOUBLES_EQUAL(0.1, JointAngle(values, 2, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(0.2, JointAngle(values, 5, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(1.1, JointVel(values, 2, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(1.2, JointVel(values, 5, 3), 1e-9);
+
+  // Check that an exception is thrown if the sizes do not match
+  CHECK_EXCEPTION(InsertJointAngles(&values, {0, 1}, 0, gtsam::Vector1(0.)),
+                  std::invalid_argument);
+  CHECK_EXCEPTION(InsertJointVels(&values, {0, 1}, 0, gtsam::Vector1(0.)),
+                  std::invalid_argument);
+}
+
+TEST(Values, InsertJointStates) {
+  gtsam::Values values;
+  InsertJointStates(&values, {2, 5}, 3, gtsam::Vector2(0.1, 0.2),
+                    gtsam::Vector2(1.1, 1.2), gtsam::Vector2(2.1, 2.2));
+
+  EXPECT_LONGS_EQUAL(6, values.size());
+  EXPECT_DOUBLES_EQUAL(0.1, JointAngle(values, 2, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(0.2, JointAngle(values, 5, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(1.1, JointVel(values, 2, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(1.2, JointVel(values, 5, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(2.1, Torque(values, 2, 3), 1e-9);
+  EXPECT_DOUBLES_EQUAL(2.2, Torque(values, 5, 3), 1e-9);
+
+  // Check that an exception is thrown if the sizes do not match
+  CHECK_EXCEPTION(InsertJointStates(&values, {0, 1}, 0, gtsam::Vector1(0.),
+                                    gtsam::Vector2(0., 0.),
+                                    gtsam::Vector2(0., 0.)),
+                  std::invalid_argument);
+}
+
 int main() {
   TestResult tr;
   return TestRegistry::runAllTests(tr);